@@ -0,0 +1,34 @@
+/**
+ * Cloudflare Worker - App 2 /ping at the edge
+ *
+ * Answers GET /ping on the app2 hostname without reaching the origin.
+ * The body matches App 2's own /ping handler, which stays in place
+ * as the fallback for any other method.
+ *
+ * Deploy with a route of: app2.YOUR_DOMAIN.com/ping
+ *
+ * Part of Limbic Capital DevOps Technical Assessment
+ */
+
+// Must match APP_NAME / APP_VERSION in docker/app2/app.py - change them together
+const HEADERS = {
+  "Content-Type": "application/json",
+  "Cache-Control": "no-store",
+  "X-Service": "app2-api-service",
+  "X-Version": "1.0.0",
+};
+
+export default {
+  async fetch(request) {
+    // Anything other than GET goes to the origin unchanged
+    if (request.method !== "GET") {
+      return fetch(request);
+    }
+
+    // Pad to microseconds so the timestamp matches App 2's format_iso()
+    const timestamp = new Date().toISOString().replace("Z", "000Z");
+    const body = `{"message":"pong","service":"app2","timestamp":"${timestamp}"}`;
+
+    return new Response(body, { headers: HEADERS });
+  },
+};
@@ -10,13 +10,27 @@ Part of Limbic Capital DevOps Technical Assessment
 Protected by Cloudflare Zero Trust Access
 """
 
+# gevent must patch socket/time/etc. before anything else imports them
+from gevent import monkey
+
+monkey.patch_all()
+
+import functools
+import hashlib
+import json
+import logging
 import os
 import platform
 import sys
 import time
-from datetime import datetime
+from importlib.metadata import version
+
+from flask import Flask, Response, request
 
-from flask import Flask, jsonify, request
+try:
+    import orjson
+except ImportError:  # orjson is CPython-only (e.g. not available on PyPy)
+    orjson = None
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -26,49 +40,248 @@ PORT = int(os.getenv("PORT", 5000))
 FLASK_ENV = os.getenv("FLASK_ENV", "development")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "info")
 
+# Logging - per-request lines are only emitted in development, so production
+# requests do not pay a write() each. LOG_LEVEL is shared with app1, so values
+# the logging module does not know fall back to INFO.
+_level = logging.getLevelName(LOG_LEVEL.upper())
+if not isinstance(_level, int):
+    _level = logging.INFO
+logger = logging.getLogger("app2")
+logger.setLevel(logging.DEBUG if FLASK_ENV == "development" else _level)
+logger.propagate = False
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("[App2] %(message)s"))
+logger.addHandler(_log_handler)
+
 # Application metadata
+# APP_NAME and APP_VERSION are repeated in cloudflare/ping-worker.js; change
+# them together
 APP_VERSION = "1.0.0"
 APP_NAME = "app2-api-service"
+# gunicorn.conf.py preloads the app, so this runs once in the master and uptime
+# covers the service as a whole rather than each (possibly recycled) worker
 START_TIME = time.time()
 
+# Runtime details, fixed for the lifetime of the process
+PLATFORM_STR = platform.platform()
+PYTHON_VERSION_SHORT = sys.version.split()[0]
+PYTHON_VERSION_FULL = sys.version
+WORKING_DIR = os.getcwd()
+PYTHON_EXEC = sys.executable
+FLASK_VERSION = version("flask")
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
 
+def format_iso(t):
+    """Format an epoch timestamp as ISO-8601 UTC without building a datetime"""
+    g = time.gmtime(t)
+    us = int((t - int(t)) * 1e6)
+    return (
+        f"{g.tm_year:04d}-{g.tm_mon:02d}-{g.tm_mday:02d}"
+        f"T{g.tm_hour:02d}:{g.tm_min:02d}:{g.tm_sec:02d}.{us:06d}Z"
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _iso_ts(bucket):
+    """Format the current UTC time once per 100ms bucket"""
+    return format_iso(time.time())
+
+
+def iso_now():
+    """Current UTC timestamp in ISO-8601, cached for up to 100ms"""
+    return _iso_ts(int(time.time() * 10))
+
+
 def get_uptime():
     """Calculate application uptime in seconds"""
     return time.time() - START_TIME
 
 
+def _split_uptime(total):
+    """Split whole seconds into (days, hours, minutes, seconds)"""
+    days, rem = divmod(total, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, secs = divmod(rem, 60)
+    return days, hours, minutes, secs
+
+
+@functools.lru_cache(maxsize=8)
+def _format_uptime_int(total):
+    """Format a whole number of seconds, memoized per second"""
+    days, hours, minutes, secs = _split_uptime(total)
+
+    return (
+        f"{('', f'{days}d ')[days > 0]}"
+        f"{('', f'{hours}h ')[hours > 0]}"
+        f"{('', f'{minutes}m ')[minutes > 0]}"
+        f"{secs}s"
+    )
+
+
 def format_uptime(seconds):
     """Format uptime in human-readable format"""
-    days = int(seconds // 86400)
-    hours = int((seconds % 86400) // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    return _format_uptime_int(int(seconds))
+
+
+# Sentinels in the precomputed bodies below, replaced by stamp() and the
+# error handlers
+TS_PLACEHOLDER = b'"__TS__"'
+MSG_PLACEHOLDER = b'"__MSG__"'
+
+if orjson is not None:
+    json_dumps = orjson.dumps
+else:
 
-    parts = []
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    parts.append(f"{secs}s")
+    def json_dumps(obj):
+        """Serialize obj to compact JSON bytes with the stdlib encoder"""
+        return json.dumps(obj, separators=(",", ":")).encode()
 
-    return " ".join(parts)
+
+def json_response(body, status=200, headers=None):
+    """Wrap an already-serialized JSON body in a response"""
+    return Response(body, status=status, headers=headers, mimetype="application/json")
+
+
+def not_modified(etag, headers):
+    """Return a 304 if the client's If-None-Match already covers etag"""
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
+    return None
+
+
+def ojsonify(obj):
+    """Serialize obj (orjson when available) and wrap it in a JSON response"""
+    return json_response(json_dumps(obj))
+
+
+def stamp(template):
+    """Fill the timestamp placeholder of a precomputed JSON body"""
+    return template.replace(TS_PLACEHOLDER, json_dumps(iso_now()))
 
 
 def log_request():
-    """Log incoming request details"""
-    forwarded_by = request.headers.get("X-Forwarded-By", "unknown")
-    print(
-        f"[App2] {request.method} {request.path} - Forwarded by: {forwarded_by}",
-        flush=True,
-    )
+    """Log incoming request details (development only)"""
+    if FLASK_ENV == "development":
+        forwarded_by = request.headers.get("X-Forwarded-By", "unknown")
+        logger.debug(
+            "%s %s - Forwarded by: %s", request.method, request.path, forwarded_by
+        )
 
 
+# ============================================================================
+# Precomputed Response Bodies
+# ============================================================================
+# These payloads only change with the timestamp, so they are serialized once
+# at import and the placeholder is swapped in per request.
+
+START_TIME_ISO = format_iso(START_TIME)
+
+_ENDPOINTS = (
+    {"path": "/", "method": "GET", "description": "Service information"},
+    {"path": "/status", "method": "GET", "description": "Service status"},
+    {"path": "/health", "method": "GET", "description": "Detailed health check"},
+    {"path": "/info", "method": "GET", "description": "System information"},
+)
+
+_AVAILABLE = ("GET /", "GET /status", "GET /health", "GET /info", "GET /ping")
+
+_HOME_TEMPLATE = json_dumps(
+    {
+        "service": APP_NAME,
+        "version": APP_VERSION,
+        "message": "App 2 API Service - Limbic Capital DevOps Assessment",
+        "status": "running",
+        "timestamp": "__TS__",
+        "endpoints": _ENDPOINTS,
+        "protection": "Cloudflare Zero Trust Access",
+    }
+)
+
+_INFO_BODY = json_dumps(
+    {
+        "service_name": APP_NAME,
+        "version": APP_VERSION,
+        "description": "Python Flask API service for Limbic Capital DevOps Assessment",
+        "author": "Limbic Capital",
+        "environment": FLASK_ENV,
+        "port": PORT,
+        "python_version": PYTHON_VERSION_FULL,
+        "flask_version": FLASK_VERSION,
+        "architecture": {
+            "layer": "Application Layer",
+            "host": "LXD container (app-host)",
+            "runtime": "Docker",
+            "network": "internal_net (Docker bridge)",
+            "exposure": "Cloudflare Tunnel with Zero Trust Access",
+            "communication": "Called by app1 via Docker DNS",
+        },
+        "security": {
+            "authentication": "Cloudflare Access",
+            "encryption": "TLS via Cloudflare",
+            "non_root_user": True,
+            "minimal_privileges": True,
+        },
+        "features": [
+            "RESTful API",
+            "JSON responses",
+            "Health monitoring",
+            "Service-to-service communication",
+            "Cloudflare Zero Trust integration",
+        ],
+    }
+)
+
+_PING_TEMPLATE = json_dumps(
+    {
+        "message": "pong",
+        "service": "app2",
+        "timestamp": "__TS__",
+    }
+)
+
+# Cache validators for the static routes so Cloudflare (and clients) can
+# revalidate instead of refetching. / differs only by timestamp, hence weak.
+CACHE_CONTROL = "public, max-age=60"
+
+_HOME_ETAG = hashlib.sha256(_HOME_TEMPLATE).hexdigest()
+_HOME_CACHE_HEADERS = {"ETag": f'W/"{_HOME_ETAG}"', "Cache-Control": CACHE_CONTROL}
+
+_INFO_ETAG = hashlib.sha256(_INFO_BODY).hexdigest()
+_INFO_CACHE_HEADERS = {"ETag": f'"{_INFO_ETAG}"', "Cache-Control": CACHE_CONTROL}
+
+_404_TEMPLATE = json_dumps(
+    {
+        "error": "Not Found",
+        "message": "__MSG__",
+        "status_code": 404,
+        "timestamp": "__TS__",
+        "available_endpoints": _AVAILABLE,
+    }
+)
+
+_500_TEMPLATE = json_dumps(
+    {
+        "error": "Internal Server Error",
+        "message": "Something went wrong",
+        "status_code": 500,
+        "timestamp": "__TS__",
+    }
+)
+
+# Development only: surfaces the exception text in place of the generic message
+_EXCEPTION_TEMPLATE = json_dumps(
+    {
+        "error": "Internal Server Error",
+        "message": "__MSG__",
+        "status_code": 500,
+        "timestamp": "__TS__",
+    }
+)
+
 # ============================================================================
 # Routes
 # ============================================================================
@@ -79,26 +292,11 @@ def home():
     """Root endpoint - Service information"""
     log_request()
 
-    return jsonify(
-        {
-            "service": APP_NAME,
-            "version": APP_VERSION,
-            "message": "App 2 API Service - Limbic Capital DevOps Assessment",
-            "status": "running",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "endpoints": [
-                {"path": "/", "method": "GET", "description": "Service information"},
-                {"path": "/status", "method": "GET", "description": "Service status"},
-                {
-                    "path": "/health",
-                    "method": "GET",
-                    "description": "Detailed health check",
-                },
-                {"path": "/info", "method": "GET", "description": "System information"},
-            ],
-            "protection": "Cloudflare Zero Trust Access",
-        }
-    )
+    cached = not_modified(_HOME_ETAG, _HOME_CACHE_HEADERS)
+    if cached is not None:
+        return cached
+
+    return json_response(stamp(_HOME_TEMPLATE), headers=_HOME_CACHE_HEADERS)
 
 
 @app.route("/status")
@@ -108,11 +306,11 @@ def status():
 
     uptime_seconds = get_uptime()
 
-    return jsonify(
+    return ojsonify(
         {
             "service": "app2",
             "status": "ok",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": iso_now(),
             "uptime_seconds": round(uptime_seconds, 2),
             "uptime": format_uptime(uptime_seconds),
             "version": APP_VERSION,
@@ -128,24 +326,24 @@ def health():
 
     uptime_seconds = get_uptime()
 
-    return jsonify(
+    return ojsonify(
         {
             "status": "healthy",
             "service": APP_NAME,
             "version": APP_VERSION,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": iso_now(),
             "uptime": {
                 "seconds": round(uptime_seconds, 2),
                 "formatted": format_uptime(uptime_seconds),
-                "started_at": datetime.fromtimestamp(START_TIME).isoformat() + "Z",
+                "started_at": START_TIME_ISO,
             },
             "environment": {
                 "flask_env": FLASK_ENV,
-                "python_version": sys.version.split()[0],
-                "platform": platform.platform(),
+                "python_version": PYTHON_VERSION_SHORT,
+                "platform": PLATFORM_STR,
                 "log_level": LOG_LEVEL,
             },
-            "system": {"python_path": sys.executable, "working_directory": os.getcwd()},
+            "system": {"python_path": PYTHON_EXEC, "working_directory": WORKING_DIR},
             "checks": {
                 "api_responsive": True,
                 "can_connect": True,
@@ -160,53 +358,24 @@ def info():
     """Information endpoint - Service metadata"""
     log_request()
 
-    return jsonify(
-        {
-            "service_name": APP_NAME,
-            "version": APP_VERSION,
-            "description": "Python Flask API service for Limbic Capital DevOps Assessment",
-            "author": "Limbic Capital",
-            "environment": FLASK_ENV,
-            "port": PORT,
-            "python_version": sys.version,
-            "flask_version": Flask.__version__,
-            "architecture": {
-                "layer": "Application Layer",
-                "host": "LXD container (app-host)",
-                "runtime": "Docker",
-                "network": "internal_net (Docker bridge)",
-                "exposure": "Cloudflare Tunnel with Zero Trust Access",
-                "communication": "Called by app1 via Docker DNS",
-            },
-            "security": {
-                "authentication": "Cloudflare Access",
-                "encryption": "TLS via Cloudflare",
-                "non_root_user": True,
-                "minimal_privileges": True,
-            },
-            "features": [
-                "RESTful API",
-                "JSON responses",
-                "Health monitoring",
-                "Service-to-service communication",
-                "Cloudflare Zero Trust integration",
-            ],
-        }
-    )
+    cached = not_modified(_INFO_ETAG, _INFO_CACHE_HEADERS)
+    if cached is not None:
+        return cached
+
+    return json_response(_INFO_BODY, headers=_INFO_CACHE_HEADERS)
+
+
+def ping_body():
+    """Serialized /ping payload, shared by the Flask route and the fast path"""
+    return stamp(_PING_TEMPLATE)
 
 
 @app.route("/ping")
 def ping():
-    """Simple ping endpoint"""
+    """Simple ping endpoint (GET is normally answered by FastPathMiddleware)"""
     log_request()
 
-    return jsonify(
-        {
-            "message": "pong",
-            "service": "app2",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-        }
-    )
+    return json_response(ping_body())
 
 
 # ============================================================================
@@ -217,84 +386,108 @@ def ping():
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify(
-        {
-            "error": "Not Found",
-            "message": f"Route {request.method} {request.path} not found",
-            "status_code": 404,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "available_endpoints": [
-                "GET /",
-                "GET /status",
-                "GET /health",
-                "GET /info",
-                "GET /ping",
-            ],
-        }
-    ), 404
+    message = json_dumps(f"Route {request.method} {request.path} not found")
+    body = stamp(_404_TEMPLATE).replace(MSG_PLACEHOLDER, message)
+
+    return json_response(body, status=404)
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    return jsonify(
-        {
-            "error": "Internal Server Error",
-            "message": "Something went wrong",
-            "status_code": 500,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-        }
-    ), 500
+    return json_response(stamp(_500_TEMPLATE), status=500)
 
 
 @app.errorhandler(Exception)
 def handle_exception(error):
     """Handle all other exceptions"""
-    print(f"[App2] Error: {str(error)}", flush=True)
+    logger.error("Error: %s", error)
 
-    return jsonify(
-        {
-            "error": "Internal Server Error",
-            "message": str(error)
-            if FLASK_ENV == "development"
-            else "Something went wrong",
-            "status_code": 500,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-        }
-    ), 500
+    if FLASK_ENV != "development":
+        return json_response(stamp(_500_TEMPLATE), status=500)
+
+    message = json_dumps(str(error))
+    body = stamp(_EXCEPTION_TEMPLATE).replace(MSG_PLACEHOLDER, message)
+
+    return json_response(body, status=500)
 
 
 # ============================================================================
-# Request/Response Middleware
+# WSGI Middleware
 # ============================================================================
 
+_SERVICE_HEADERS = (("X-Service", APP_NAME), ("X-Version", APP_VERSION))
 
-@app.before_request
-def before_request():
-    """Log before each request"""
-    request.start_time = time.time()
 
+@functools.lru_cache(maxsize=256)
+def _fmt_ms(ms):
+    """Format a whole-millisecond duration for X-Response-Time"""
+    return f"{ms}ms"
 
-@app.after_request
-def after_request(response):
-    """Log after each request and add headers"""
-    # Add custom headers
-    response.headers["X-Service"] = APP_NAME
-    response.headers["X-Version"] = APP_VERSION
 
-    # Calculate request duration
-    if hasattr(request, "start_time"):
-        duration = time.time() - request.start_time
-        response.headers["X-Response-Time"] = f"{duration:.3f}s"
+class ResponseHeadersMiddleware:
+    """Add the service and timing headers to every response in one extend
 
-    # Log response
-    if FLASK_ENV == "development":
-        print(
-            f"[App2] Response: {response.status_code} - {response.headers.get('X-Response-Time', 'N/A')}",
-            flush=True,
+    Headers are appended to the raw list passed to start_response, covering
+    the fast path as well as Flask and skipping the case-insensitive
+    bookkeeping of Werkzeug's Headers. Timing starts at the WSGI entry point.
+    """
+
+    def __init__(self, wsgi_app, headers):
+        self.wsgi_app = wsgi_app
+        self.headers = headers
+
+    def __call__(self, environ, start_response):
+        start_ns = time.perf_counter_ns()
+
+        def _start_response(status, headers, exc_info=None):
+            response_time = _fmt_ms((time.perf_counter_ns() - start_ns) // 1_000_000)
+            headers.extend((*self.headers, ("X-Response-Time", response_time)))
+
+            if FLASK_ENV == "development":
+                logger.debug("Response: %s - %s", status[:3], response_time)
+
+            return start_response(status, headers, exc_info)
+
+        return self.wsgi_app(environ, _start_response)
+
+
+class FastPathMiddleware:
+    """Answer trivial GET routes without entering Flask
+
+    Requests for paths in ``routes`` skip Werkzeug routing and the Flask
+    request context entirely; each route maps to a function returning the
+    serialized JSON body. Everything else falls through to the wrapped app.
+    """
+
+    def __init__(self, wsgi_app, routes):
+        self.wsgi_app = wsgi_app
+        self.routes = routes
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        body_fn = self.routes.get(path)
+        if body_fn is None or environ.get("REQUEST_METHOD") != "GET":
+            return self.wsgi_app(environ, start_response)
+
+        if FLASK_ENV == "development":
+            forwarded_by = environ.get("HTTP_X_FORWARDED_BY", "unknown")
+            logger.debug("GET %s - Forwarded by: %s", path, forwarded_by)
+
+        body = body_fn()
+        start_response(
+            "200 OK",
+            [
+                ("Content-Type", "application/json"),
+                ("Content-Length", str(len(body))),
+            ],
         )
+        return [body]
+
 
-    return response
+app.wsgi_app = ResponseHeadersMiddleware(
+    FastPathMiddleware(app.wsgi_app, {"/ping": ping_body}), _SERVICE_HEADERS
+)
 
 
 # ============================================================================
@@ -311,14 +504,9 @@ def print_banner():
     print(f"Version: {APP_VERSION}")
     print(f"Environment: {FLASK_ENV}")
     print(f"Port: {PORT}")
-    print(f"Python: {sys.version.split()[0]}")
-    try:
-        import flask
-
-        print(f"Flask: {flask.__version__}")
-    except:
-        print("Flask: (version unavailable)")
-    print(f"Started: {datetime.utcnow().isoformat()}Z")
+    print(f"Python: {PYTHON_VERSION_SHORT}")
+    print(f"Flask: {FLASK_VERSION}")
+    print(f"Started: {format_iso(time.time())}")
     print("=" * 60)
     print("Available endpoints:")
     print("  GET  /           - Service information")
@@ -332,12 +520,7 @@ def print_banner():
 
 
 if __name__ == "__main__":
-    print_banner()
-
-    # Run Flask app
-    app.run(
-        host="0.0.0.0",
-        port=PORT,
-        debug=(FLASK_ENV == "development"),
-        use_reloader=False,  # Disable reloader in production
+    # The Flask dev server handles one request at a time; serve via gunicorn
+    sys.exit(
+        "Use: gunicorn -k gevent -w $((2*$(nproc)+1)) --worker-connections 1024 app:app"
     )
@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for App 2
+
+Server flags (workers, worker class, bind) are passed on the command line in
+the Dockerfile; this file sets app preloading and the startup banner hook.
+"""
+
+import sys
+
+# Import app.py once in the master and fork the workers from it, so they share
+# the loaded modules and precomputed bodies through copy-on-write
+preload_app = True
+
+
+def post_worker_init(worker):
+    """Print the startup banner once, from the first worker spawned"""
+    # Runs inside the worker once app.py is loaded there, so this hook never
+    # imports (and monkey-patches) app.py in the master on its own
+    if worker.age != 1:
+        return
+
+    from app import print_banner
+
+    print_banner()
+    sys.stdout.flush()